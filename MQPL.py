@@ -1,16 +1,45 @@
 from abc import ABC, abstractmethod
+from contextlib import redirect_stdout
+from collections import deque
 from datetime import datetime
+from io import StringIO
 from typing import List
+from weakref import WeakSet
+import sys
+import time
 import unittest
 
 
+RAPPORT_EQUIPE = "Équipe:"
+RAPPORT_TACHES = "Tâches:"
+RAPPORT_JALONS = "Jalons:"
+RAPPORT_RISQUES = "Risques:"
+RAPPORT_CHEMIN_CRITIQUE = "Chemin Critique:"
+
+
 class Membre:
+    __slots__ = ("nom", "role")
+
     def __init__(self, nom: str, role: str):
         self.nom = nom
         self.role = role
 
 
 class Tache:
+    __slots__ = (
+        "nom",
+        "description",
+        "_date_debut",
+        "_date_fin",
+        "responsable",
+        "statut",
+        "_dependances",
+        "duree_jours",
+        "debut_str",
+        "fin_str",
+        "_projets",
+    )
+
     def __init__(
         self,
         nom: str,
@@ -23,14 +52,50 @@ class Tache:
     ):
         self.nom = nom
         self.description = description
-        self.date_debut = date_debut
-        self.date_fin = date_fin
+        self._date_debut = date_debut
+        self._date_fin = date_fin
         self.responsable = responsable
         self.statut = statut
-        self.dependances = dependances or []
+        self._dependances = list(dependances or [])
+        self._projets = WeakSet()
+        self.refresh_duration()
+
+    @property
+    def dependances(self) -> tuple:
+        return tuple(self._dependances)
+
+    @property
+    def date_debut(self) -> datetime:
+        return self._date_debut
+
+    @date_debut.setter
+    def date_debut(self, date_debut: datetime):
+        self._date_debut = date_debut
+        self.refresh_duration()
+
+    @property
+    def date_fin(self) -> datetime:
+        return self._date_fin
+
+    @date_fin.setter
+    def date_fin(self, date_fin: datetime):
+        self._date_fin = date_fin
+        self.refresh_duration()
+
+    def refresh_duration(self):
+        self.duree_jours = (self._date_fin - self._date_debut).days
+        self.debut_str = str(self._date_debut)
+        self.fin_str = str(self._date_fin)
+        for projet in self._projets:
+            projet.invalidate_critical_path()
 
     def ajouter_dependance(self, tache: "Tache"):
-        self.dependances.append(tache)
+        self._dependances.append(tache)
+        for projet in self._projets:
+            projet.invalidate_critical_path()
+
+    def enregistrer_projet(self, projet: "Projet"):
+        self._projets.add(projet)
 
     def mettre_a_jour_statut(self, statut: str):
         self.statut = statut
@@ -48,12 +113,16 @@ class Equipe:
 
 
 class Jalon:
+    __slots__ = ("nom", "date")
+
     def __init__(self, nom: str, date: datetime):
         self.nom = nom
         self.date = date
 
 
 class Risque:
+    __slots__ = ("description", "probabilite", "impact")
+
     def __init__(self, description: str, probabilite: float, impact: str):
         self.description = description
         self.probabilite = probabilite
@@ -61,10 +130,25 @@ class Risque:
 
 
 class Changement:
-    def __init__(self, description: str, version: int):
+    __slots__ = ("description", "version", "_ts", "_date")
+
+    def __init__(self, description: str, version: int, date: datetime = None):
         self.description = description
         self.version = version
-        self.date = datetime.now()
+        self._ts = time.time() if date is None else None
+        self._date = date
+
+    @property
+    def date(self) -> datetime:
+        if self._ts is not None:
+            self._date = datetime.fromtimestamp(self._ts)
+            self._ts = None
+        return self._date
+
+    @date.setter
+    def date(self, date: datetime):
+        self._date = date
+        self._ts = None
 
 
 class NotificationStrategy(ABC):
@@ -73,19 +157,44 @@ class NotificationStrategy(ABC):
         pass
 
 
-class EmailNotificationStrategy(NotificationStrategy):
-    def envoyer_message(self, message: str, destinataire: Membre):
-        print(f"Notification envoyée à {destinataire.nom} par email: {message}")
+class CanalNotificationStrategy(NotificationStrategy):
+    canal = ""
 
+    def _prefixe(self, nom: str) -> str:
+        prefixes = getattr(self, "_prefixes", None)
+        if prefixes is None:
+            prefixes = self._prefixes = {}
+        prefixe = prefixes.get(nom)
+        if prefixe is None:
+            prefixe = prefixes[nom] = (
+                f"Notification envoyée à {nom} par {self.canal}: "
+            )
+        return prefixe
 
-class SMSNotificationStrategy(NotificationStrategy):
     def envoyer_message(self, message: str, destinataire: Membre):
-        print(f"Notification envoyée à {destinataire.nom} par SMS: {message}")
+        sys.stdout.write(self._prefixe(destinataire.nom) + message + "\n")
 
+    def envoyer_messages_bulk(self, message: str, destinataires: List[Membre]):
+        if type(self).envoyer_message is not CanalNotificationStrategy.envoyer_message:
+            for destinataire in destinataires:
+                self.envoyer_message(message, destinataire)
+        elif destinataires:
+            suffixe = message + "\n"
+            sys.stdout.write(
+                "".join(self._prefixe(d.nom) + suffixe for d in destinataires)
+            )
 
-class PushNotificationStrategy(NotificationStrategy):
-    def envoyer_message(self, message: str, destinataire: Membre):
-        print(f"Notification envoyée à {destinataire.nom} par Push: {message}")
+
+class EmailNotificationStrategy(CanalNotificationStrategy):
+    canal = "email"
+
+
+class SMSNotificationStrategy(CanalNotificationStrategy):
+    canal = "SMS"
+
+
+class PushNotificationStrategy(CanalNotificationStrategy):
+    canal = "Push"
 
 
 class NotificationContext:
@@ -96,8 +205,13 @@ class NotificationContext:
         self.strategy = strategy
 
     def notifier(self, message: str, destinataires: List[Membre]):
+        bulk = getattr(self.strategy, "envoyer_messages_bulk", None)
+        if bulk is not None:
+            bulk(message, destinataires)
+            return
+        send = self.strategy.envoyer_message
         for destinataire in destinataires:
-            self.strategy.envoyer_message(message, destinataire)
+            send(message, destinataire)
 
 
 class Projet:
@@ -116,6 +230,8 @@ class Projet:
         self.version = 1
         self.changements = []
         self.chemin_critique = []
+        self._critical_path_dirty = True
+        self._nb_taches_calculees = 0
         self.notification_context = None
 
     def set_notification_strategy(self, strategy: NotificationStrategy):
@@ -123,6 +239,7 @@ class Projet:
 
     def ajouter_tache(self, tache: Tache):
         self.taches.append(tache)
+        self.invalidate_critical_path()
         self.notifier(f"Nouvelle tâche ajoutée: {tache.nom}")
 
     def ajouter_membre_equipe(self, membre: Membre):
@@ -149,52 +266,95 @@ class Projet:
         self.version += 1
         self.notifier(f"Changement enregistré: {description} (version {self.version})")
 
-    def calculer_chemin_critique(self):
-        def find_longest_path(tache, memo):
-            if tache in memo:
-                return memo[tache]
-            if not tache.dependances:
-                memo[tache] = (0, [tache])
-                return memo[tache]
-            max_length, max_path = 0, []
+    def _build_reverse_adj(self):
+        taches = list(self.taches)
+        indeg = {tache: 0 for tache in taches}
+        succs = {tache: [] for tache in taches}
+        for tache in taches:
             for dep in tache.dependances:
-                dep_length, dep_path = find_longest_path(dep, memo)
-                if dep_length > max_length:
-                    max_length = dep_length
-                    max_path = dep_path
-            total_length = max_length + (tache.date_fin - tache.date_debut).days
-            memo[tache] = (total_length, max_path + [tache])
-            return memo[tache]
-
-        memo = {}
-        all_paths = [find_longest_path(tache, memo) for tache in self.taches]
-        self.chemin_critique = max(all_paths, key=lambda x: x[0])[1]
+                if dep not in indeg:
+                    indeg[dep] = 0
+                    succs[dep] = []
+                    taches.append(dep)
+                indeg[tache] += 1
+                succs[dep].append(tache)
+        return indeg, succs
+
+    def invalidate_critical_path(self):
+        """À appeler après une modification directe de ``self.taches``."""
+        self._critical_path_dirty = True
+
+    def calculer_chemin_critique(self):
+        if not self._critical_path_dirty and self._nb_taches_calculees == len(
+            self.taches
+        ):
+            return self.chemin_critique
+        indeg, succs = self._build_reverse_adj()
+        for tache in indeg:
+            tache.enregistrer_projet(self)
+        longueur = {tache: tache.duree_jours for tache in indeg}
+        parent = dict.fromkeys(indeg)
+        file = deque(tache for tache, degre in indeg.items() if degre == 0)
+        traitees = 0
+        fin = None
+        while file:
+            tache = file.popleft()
+            traitees += 1
+            if fin is None or longueur[tache] >= longueur[fin]:
+                fin = tache
+            for succ in succs[tache]:
+                candidat = longueur[tache] + succ.duree_jours
+                if parent[succ] is None or candidat > longueur[succ]:
+                    longueur[succ] = candidat
+                    parent[succ] = tache
+                indeg[succ] -= 1
+                if indeg[succ] == 0:
+                    file.append(succ)
+        if traitees < len(indeg):
+            raise ValueError("dépendances cycliques")
+
+        chemin = []
+        tache = fin
+        while tache is not None:
+            chemin.append(tache)
+            tache = parent[tache]
+        chemin.reverse()
+        self.chemin_critique = chemin
+        self._critical_path_dirty = False
+        self._nb_taches_calculees = len(self.taches)
+        return chemin
 
     def notifier(self, message: str):
         if self.notification_context:
             self.notification_context.notifier(message, self.equipe.membres)
 
     def generer_rapport(self):
-        rapport = f"Rapport d'activités du Projet '{self.nom}':\n"
-        rapport += f"Version: {self.version}\n"
-        rapport += f"Dates: {self.date_debut} à {self.date_fin}\n"
-        rapport += f"Budget: {self.budget} Unité Monétaire\n"
-        rapport += "Équipe:\n"
+        parts = []
+        append = parts.append
+        append(f"Rapport d'activités du Projet '{self.nom}':")
+        append(f"Version: {self.version}")
+        append(f"Dates: {self.date_debut} à {self.date_fin}")
+        append(f"Budget: {self.budget} Unité Monétaire")
+        append(RAPPORT_EQUIPE)
         for membre in self.equipe.membres:
-            rapport += f"- {membre.nom} ({membre.role})\n"
-        rapport += "Tâches:\n"
+            append(f"- {membre.nom} ({membre.role})")
+        append(RAPPORT_TACHES)
         for tache in self.taches:
-            rapport += f"- {tache.nom} ({tache.date_debut} à {tache.date_fin}), Responsable: {tache.responsable.nom}, Statut: {tache.statut}\n"
-        rapport += "Jalons:\n"
+            append(
+                f"- {tache.nom} ({tache.debut_str} à {tache.fin_str}), Responsable: {tache.responsable.nom}, Statut: {tache.statut}"
+            )
+        append(RAPPORT_JALONS)
         for jalon in self.jalons:
-            rapport += f"- {jalon.nom} ({jalon.date})\n"
-        rapport += "Risques:\n"
+            append(f"- {jalon.nom} ({jalon.date})")
+        append(RAPPORT_RISQUES)
         for risque in self.risques:
-            rapport += f"- {risque.description} (Probabilité: {risque.probabilite}, Impact: {risque.impact})\n"
-        rapport += "Chemin Critique:\n"
+            append(
+                f"- {risque.description} (Probabilité: {risque.probabilite}, Impact: {risque.impact})"
+            )
+        append(RAPPORT_CHEMIN_CRITIQUE)
         for tache in self.chemin_critique:
-            rapport += f"- {tache.nom} ({tache.date_debut} à {tache.date_fin})\n"
-        return rapport
+            append(f"- {tache.nom} ({tache.debut_str} à {tache.fin_str})")
+        return "\n".join(parts) + "\n"
 
 
 # Tests unitaires
@@ -215,6 +375,53 @@ class TestProjet(unittest.TestCase):
         self.projet.ajouter_membre_equipe(self.modou)
         self.assertIn(self.modou, self.projet.equipe.obtenir_membres())
 
+    def test_notifier_equipe(self):
+        self.projet.ajouter_membre_equipe(self.modou)
+        self.projet.ajouter_membre_equipe(self.christian)
+        sortie = StringIO()
+        with redirect_stdout(sortie):
+            self.projet.notifier("Réunion à 10h")
+        self.assertEqual(
+            sortie.getvalue(),
+            "Notification envoyée à Brahim par email: Réunion à 10h\n"
+            "Notification envoyée à Pape par email: Réunion à 10h\n",
+        )
+
+    def test_notifier_apres_renommage(self):
+        self.projet.ajouter_membre_equipe(self.modou)
+        self.modou.nom = "Modou"
+        sortie = StringIO()
+        with redirect_stdout(sortie):
+            self.projet.notifier("Réunion à 10h")
+        self.assertEqual(
+            sortie.getvalue(),
+            "Notification envoyée à Modou par email: Réunion à 10h\n",
+        )
+
+    def test_notifier_strategie_personnalisee(self):
+        class JournalStrategy(NotificationStrategy):
+            def __init__(self):
+                self.envois = []
+
+            def envoyer_message(self, message: str, destinataire: Membre):
+                self.envois.append((destinataire.nom, message))
+
+        class EmailSilencieuxStrategy(EmailNotificationStrategy):
+            def __init__(self):
+                self.envois = []
+
+            def envoyer_message(self, message: str, destinataire: Membre):
+                self.envois.append((destinataire.nom, message))
+
+        self.projet.ajouter_membre_equipe(self.modou)
+        for strategy in (JournalStrategy(), EmailSilencieuxStrategy()):
+            self.projet.set_notification_strategy(strategy)
+            sortie = StringIO()
+            with redirect_stdout(sortie):
+                self.projet.notifier("Réunion à 10h")
+            self.assertEqual(sortie.getvalue(), "")
+            self.assertEqual(strategy.envois, [("Brahim", "Réunion à 10h")])
+
     def test_ajouter_tache(self):
         tache1 = Tache(
             "Analyse des besoins",
@@ -227,6 +434,23 @@ class TestProjet(unittest.TestCase):
         self.projet.ajouter_tache(tache1)
         self.assertIn(tache1, self.projet.taches)
 
+    def test_modifier_dates_tache(self):
+        tache = Tache(
+            "Analyse des besoins",
+            "Description de l'analyse des besoins",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            self.modou,
+            "Terminée",
+        )
+        self.projet.ajouter_tache(tache)
+        tache.date_fin = datetime(2024, 3, 3)
+        self.assertEqual(tache.duree_jours, 62)
+        self.assertIn(
+            "Analyse des besoins (2024-01-01 00:00:00 à 2024-03-03 00:00:00)",
+            self.projet.generer_rapport(),
+        )
+
     def test_definir_budget(self):
         self.projet.definir_budget(50000.0)
         self.assertEqual(self.projet.budget, 50000.0)
@@ -248,6 +472,18 @@ class TestProjet(unittest.TestCase):
             self.projet.changements[0].description, "Changement de la portée du projet"
         )
 
+    def test_changement_date(self):
+        avant = datetime.now()
+        changement = Changement("Changement de la portée du projet", 1)
+        apres = datetime.now()
+        self.assertTrue(avant <= changement.date <= apres)
+        date = datetime(2024, 3, 1)
+        self.assertEqual(Changement("Import", 2, date=date).date, date)
+        changement.date = date
+        self.assertEqual(changement.date, date)
+        changement.date = None
+        self.assertIsNone(changement.date)
+
     def test_calculer_chemin_critique(self):
         tache1 = Tache(
             "Analyse des besoins",
@@ -271,6 +507,234 @@ class TestProjet(unittest.TestCase):
         self.projet.calculer_chemin_critique()
         self.assertEqual(self.projet.chemin_critique, [tache1, tache2])
 
+    def test_calculer_chemin_critique_branche_la_plus_longue(self):
+        tache1 = Tache(
+            "Analyse des besoins",
+            "Description de l'analyse des besoins",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            self.modou,
+            "Terminée",
+        )
+        tache2 = Tache(
+            "Maquettes",
+            "Description des maquettes",
+            datetime(2024, 2, 1),
+            datetime(2024, 2, 10),
+            self.christian,
+            "Non démarrée",
+            dependances=[tache1],
+        )
+        tache3 = Tache(
+            "Développement",
+            "Description du développement",
+            datetime(2024, 2, 1),
+            datetime(2024, 6, 30),
+            self.christian,
+            "Non démarrée",
+            dependances=[tache1],
+        )
+        tache4 = Tache(
+            "Livraison",
+            "Description de la livraison",
+            datetime(2024, 7, 1),
+            datetime(2024, 7, 15),
+            self.modou,
+            "Non démarrée",
+            dependances=[tache2, tache3],
+        )
+        for tache in (tache4, tache3, tache2, tache1):
+            self.projet.ajouter_tache(tache)
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(self.projet.chemin_critique, [tache1, tache3, tache4])
+
+    def test_calculer_chemin_critique_apres_ajout_dependance(self):
+        tache1 = Tache(
+            "Analyse des besoins",
+            "Description de l'analyse des besoins",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            self.modou,
+            "Terminée",
+        )
+        tache2 = Tache(
+            "Développement",
+            "Description du développement",
+            datetime(2024, 2, 1),
+            datetime(2024, 6, 30),
+            self.christian,
+            "Non démarrée",
+        )
+        self.projet.ajouter_tache(tache1)
+        self.projet.ajouter_tache(tache2)
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(self.projet.chemin_critique, [tache2])
+        tache2.ajouter_dependance(tache1)
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(self.projet.chemin_critique, [tache1, tache2])
+
+    def test_calculer_chemin_critique_dependance_hors_projet(self):
+        tache0 = Tache(
+            "Étude de marché",
+            "Description de l'étude de marché",
+            datetime(2023, 11, 1),
+            datetime(2023, 12, 31),
+            self.modou,
+            "Terminée",
+        )
+        tache1 = Tache(
+            "Analyse des besoins",
+            "Description de l'analyse des besoins",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            self.modou,
+            "Terminée",
+        )
+        tache2 = Tache(
+            "Développement",
+            "Description du développement",
+            datetime(2024, 2, 1),
+            datetime(2024, 6, 30),
+            self.christian,
+            "Non démarrée",
+            dependances=[tache1],
+        )
+        self.projet.ajouter_tache(tache2)
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(self.projet.chemin_critique, [tache1, tache2])
+        tache1.ajouter_dependance(tache0)
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(self.projet.chemin_critique, [tache0, tache1, tache2])
+        tache3 = Tache(
+            "Recette",
+            "Description de la recette",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+            self.modou,
+            "Non démarrée",
+        )
+        self.projet.taches.append(tache3)
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(self.projet.chemin_critique, [tache3])
+        tache3.date_fin = datetime(2024, 1, 2)
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(self.projet.chemin_critique, [tache0, tache1, tache2])
+
+    def test_calculer_chemin_critique_tache_partagee(self):
+        autre_projet = Projet(
+            "Autre Produit",
+            "Développement d'un autre produit",
+            datetime(2024, 1, 1),
+            datetime(2024, 12, 31),
+        )
+        tache1 = Tache(
+            "Analyse des besoins",
+            "Description de l'analyse des besoins",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            self.modou,
+            "Terminée",
+        )
+        tache2 = Tache(
+            "Développement",
+            "Description du développement",
+            datetime(2024, 2, 1),
+            datetime(2024, 6, 30),
+            self.christian,
+            "Non démarrée",
+        )
+        self.projet.ajouter_tache(tache2)
+        autre_projet.ajouter_tache(tache2)
+        self.projet.calculer_chemin_critique()
+        autre_projet.calculer_chemin_critique()
+        tache2.ajouter_dependance(tache1)
+        self.assertEqual(self.projet.calculer_chemin_critique(), [tache1, tache2])
+        self.assertEqual(autre_projet.calculer_chemin_critique(), [tache1, tache2])
+
+    def test_dependances_en_lecture_seule(self):
+        tache = Tache(
+            "Analyse des besoins",
+            "Description de l'analyse des besoins",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            self.modou,
+            "Terminée",
+        )
+        with self.assertRaises(AttributeError):
+            tache.dependances.append(tache)
+
+    def test_calculer_chemin_critique_dependances_cycliques(self):
+        tache1 = Tache(
+            "Analyse des besoins",
+            "Description de l'analyse des besoins",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            self.modou,
+            "Terminée",
+        )
+        tache2 = Tache(
+            "Développement",
+            "Description du développement",
+            datetime(2024, 2, 1),
+            datetime(2024, 6, 30),
+            self.christian,
+            "Non démarrée",
+            dependances=[tache1],
+        )
+        tache1.ajouter_dependance(tache2)
+        self.projet.ajouter_tache(tache1)
+        self.projet.ajouter_tache(tache2)
+        with self.assertRaises(ValueError):
+            self.projet.calculer_chemin_critique()
+
+    def test_calculer_chemin_critique_successeur_sans_duree(self):
+        tache1 = Tache(
+            "Développement",
+            "Description du développement",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 31),
+            self.christian,
+            "Non démarrée",
+        )
+        tache2 = Tache(
+            "Livraison",
+            "Description de la livraison",
+            datetime(2024, 1, 31),
+            datetime(2024, 1, 31),
+            self.modou,
+            "Non démarrée",
+            dependances=[tache1],
+        )
+        for ordre in ([tache1, tache2], [tache2, tache1]):
+            projet = Projet(
+                "Nouveau Produit",
+                "Développement d'un nouveau produit",
+                datetime(2024, 1, 1),
+                datetime(2024, 12, 31),
+            )
+            for tache in ordre:
+                projet.ajouter_tache(tache)
+            self.assertEqual(projet.calculer_chemin_critique(), [tache1, tache2])
+
+    def test_calculer_chemin_critique_chaine_longue(self):
+        taches = []
+        precedente = None
+        for i in range(5000):
+            tache = Tache(
+                f"Tâche {i}",
+                f"Description de la tâche {i}",
+                datetime(2024, 1, 1),
+                datetime(2024, 1, 2),
+                self.modou,
+                "Non démarrée",
+                dependances=[precedente] if precedente else None,
+            )
+            self.projet.ajouter_tache(tache)
+            taches.append(tache)
+            precedente = tache
+        self.projet.calculer_chemin_critique()
+        self.assertEqual(self.projet.chemin_critique, taches)
+
     def test_generer_rapport(self):
         self.projet.ajouter_membre_equipe(self.modou)
         self.projet.ajouter_membre_equipe(self.christian)